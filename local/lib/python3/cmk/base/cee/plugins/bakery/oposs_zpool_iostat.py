@@ -4,7 +4,6 @@ CheckMK Agent Bakery plugin for OPOSS zpool iostat monitoring
 Provides centralized deployment and configuration management for zpool iostat agent plugin
 """
 
-import json
 from cmk.base.plugins.bakery.bakery_api.v1 import (
     register,
     Plugin,
@@ -29,20 +28,21 @@ def get_oposs_zpool_iostat_files(conf: Dict[str, Any]):
 
     # Get configuration values with defaults
     interval = int(conf.get("interval", 60))
-    timeout = conf.get("timeout", 30)
-    sampling_duration = conf.get("sampling_duration", 10)
+    timeout = int(conf.get("timeout", 30))
+    sampling_duration = int(conf.get("sampling_duration", 10))
     
-    # Generate JSON configuration file for the agent
-    config_content = json.dumps({
-        "timeout": int(timeout),
-        "sampling_duration": int(sampling_duration),
-    }, indent=2)
-    
-    # Deploy configuration file
+    # Generate JSON configuration file for the agent. The structure is fixed
+    # and only holds integers, so the lines are built directly instead of
+    # serializing and splitting a JSON string.
     yield PluginConfig(
         base_os=OS.LINUX,
         target=Path("oposs_zpool_iostat.json"),
-        lines=config_content.splitlines(),
+        lines=[
+            '{',
+            f'  "timeout": {timeout},',
+            f'  "sampling_duration": {sampling_duration}',
+            '}',
+        ],
     )
     
     # Deploy the Python agent plugin
@@ -22,11 +22,163 @@ from cmk.agent_based.v2 import (
     render,
     check_levels,
 )
-from typing import Any, Dict, List, Mapping, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 import json
 
+# orjson (or ujson) is considerably faster than the stdlib parser on the
+# number-heavy iostat payloads; fall back to json where neither is available.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ujson = None
+if orjson is None:
+    try:
+        import ujson
+    except ImportError:
+        pass
+
+if orjson is not None:
+    _loads = orjson.loads
+    _JSON_DECODE_ERRORS: Tuple[type, ...] = (json.JSONDecodeError, orjson.JSONDecodeError)
+elif ujson is not None:
+    _loads = ujson.loads
+    # Older ujson releases only raise a plain ValueError
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, getattr(ujson, 'JSONDecodeError', ValueError))
+else:
+    _loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# msgspec (optional) decodes pool payloads straight into compact structs
+# instead of building a dict with ~30 keys per pool
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Numeric value as reported by the agent
+_Number = Union[int, float]
+
+if msgspec is not None:
+    _JSON_DECODE_ERRORS += (msgspec.DecodeError,)
+    
+    class PoolData(msgspec.Struct, frozen=True, gc=False):
+        """
+        Metrics of a single pool as reported by the agent.
+        
+        Fields the agent did not report are None, except for the basic
+        counters which default to 0 like in the dict representation.
+        Unknown fields sent by newer agents are ignored.
+        """
+        pool: str = ''
+        alloc: _Number = 0
+        free: _Number = 0
+        read_ops: _Number = 0
+        write_ops: _Number = 0
+        read_bytes: _Number = 0
+        write_bytes: _Number = 0
+        read_wait: Optional[_Number] = None
+        write_wait: Optional[_Number] = None
+        disk_read_wait: Optional[_Number] = None
+        disk_write_wait: Optional[_Number] = None
+        syncq_read_wait: Optional[_Number] = None
+        syncq_write_wait: Optional[_Number] = None
+        asyncq_read_wait: Optional[_Number] = None
+        asyncq_write_wait: Optional[_Number] = None
+        scrub_wait: Optional[_Number] = None
+        trim_wait: Optional[_Number] = None
+        rebuild_wait: Optional[_Number] = None
+        syncq_read_pend: Optional[_Number] = None
+        syncq_read_activ: Optional[_Number] = None
+        syncq_write_pend: Optional[_Number] = None
+        syncq_write_activ: Optional[_Number] = None
+        asyncq_read_pend: Optional[_Number] = None
+        asyncq_read_activ: Optional[_Number] = None
+        asyncq_write_pend: Optional[_Number] = None
+        asyncq_write_activ: Optional[_Number] = None
+        scrubq_read_pend: Optional[_Number] = None
+        scrubq_read_activ: Optional[_Number] = None
+        trimq_write_pend: Optional[_Number] = None
+        trimq_write_activ: Optional[_Number] = None
+        rebuildq_write_pend: Optional[_Number] = None
+        rebuildq_write_activ: Optional[_Number] = None
+    
+    _POOL_DATA_TYPES: Tuple[type, ...] = (dict, PoolData)
+    _decode_pool_struct = msgspec.json.Decoder(PoolData).decode
+    _decode_all_pool_structs = msgspec.json.Decoder(Dict[str, PoolData]).decode
+else:
+    _POOL_DATA_TYPES = (dict,)
+
+# Payloads larger than this are rejected without decoding. Real agent output
+# is orders of magnitude smaller; this keeps corrupted output (e.g. huge
+# number strings, which the stdlib decoder handles poorly) from stalling
+# the parser.
+_MAX_PAYLOAD_SIZE = 16 * 1024 * 1024
+
 # ZFS iostat data is now parsed from JSON format by the agent
 
+# Item of the agent line carrying all pools as one JSON document. ZFS pool
+# names must begin with a letter, so this can never clash with a pool.
+_ALL_POOLS_MARKER = "_ALL"
+
+# Value reported for metrics missing from the agent data
+_NAN = float('nan')
+
+# Wait time metric names in seconds, as reported to CheckMK
+_READ_WAIT_S = 'read_wait_s'
+_WRITE_WAIT_S = 'write_wait_s'
+_DISK_READ_WAIT_S = 'disk_read_wait_s'
+_DISK_WRITE_WAIT_S = 'disk_write_wait_s'
+_DISK_WAIT_MAX_S = 'disk_wait_max_s'
+
+# Queue wait time metrics:
+# (agent field, metric name in seconds, levels parameter, label)
+_QUEUE_WAIT_METRICS = (
+    ('syncq_read_wait', 'syncq_read_wait_s', 'syncq_read_wait_levels', 'Sync Queue Read Wait'),
+    ('syncq_write_wait', 'syncq_write_wait_s', 'syncq_write_wait_levels', 'Sync Queue Write Wait'),
+    ('asyncq_read_wait', 'asyncq_read_wait_s', 'asyncq_read_wait_levels', 'Async Queue Read Wait'),
+    ('asyncq_write_wait', 'asyncq_write_wait_s', 'asyncq_write_wait_levels', 'Async Queue Write Wait'),
+    ('scrub_wait', 'scrub_wait_s', 'scrub_wait_levels', 'Scrub Wait'),
+    ('trim_wait', 'trim_wait_s', 'trim_wait_levels', 'Trim Wait'),
+    ('rebuild_wait', 'rebuild_wait_s', 'rebuild_wait_levels', 'Rebuild Wait'),
+)
+
+# Check parameter holding the queue depth levels
+_QUEUE_THRESHOLDS = 'queue_thresholds'
+
+# Queue depth metrics: (metric name, levels parameter)
+_RAW_QUEUE_DEPTH_METRICS = (
+    ('syncq_read_pend', 'syncq_read_pend_levels'),
+    ('syncq_read_activ', 'syncq_read_activ_levels'),
+    ('syncq_write_pend', 'syncq_write_pend_levels'),
+    ('syncq_write_activ', 'syncq_write_activ_levels'),
+    ('asyncq_read_pend', 'asyncq_read_pend_levels'),
+    ('asyncq_read_activ', 'asyncq_read_activ_levels'),
+    ('asyncq_write_pend', 'asyncq_write_pend_levels'),
+    ('asyncq_write_activ', 'asyncq_write_activ_levels'),
+    ('scrubq_read_pend', 'scrubq_read_pend_levels'),
+    ('scrubq_read_activ', 'scrubq_read_activ_levels'),
+    ('trimq_write_pend', 'trimq_write_pend_levels'),
+    ('trimq_write_activ', 'trimq_write_activ_levels'),
+    ('rebuildq_write_pend', 'rebuildq_write_pend_levels'),
+    ('rebuildq_write_activ', 'rebuildq_write_activ_levels'),
+)
+
+
+# NaN metrics for missing values, shared between check runs. Metric is an
+# immutable tuple, so handing out the same instance repeatedly is safe.
+_MISSING_METRIC_CACHE: Dict[str, Metric] = {}
+
+def _missing_metric(metric_name: str) -> Metric:
+    """Return the (cached) NaN metric reported for a missing value."""
+    metric = _MISSING_METRIC_CACHE.get(metric_name)
+    if metric is None:
+        metric = Metric(metric_name, _NAN)
+        _MISSING_METRIC_CACHE[metric_name] = metric
+    return metric
+
 def _render_operations_per_second(value: float) -> str:
     """Render operations per second with 1 decimal place."""
     return f"{value:.1f}/s"
@@ -41,25 +193,60 @@ def _render_count(value: float) -> str:
     """Render value as count with no decimal places."""
     return f"{value:.0f}"
 
-def _extract_levels(levels_param):
+# I/O operation and throughput metrics:
+# (agent field, metric name, levels parameter, label, render function)
+_METRIC_PLAN = (
+    ('read_ops', 'read_ops', 'read_ops_levels', 'Read operations', _render_operations_per_second),
+    ('write_ops', 'write_ops', 'write_ops_levels', 'Write operations', _render_operations_per_second),
+    ('read_bytes', 'read_throughput', 'read_throughput_levels', 'Read throughput', render.bytes),
+    ('write_bytes', 'write_throughput', 'write_throughput_levels', 'Write throughput', render.bytes),
+)
+
+# Queue depth metrics with their labels derived once at import:
+# (metric name, levels parameter, label, render function)
+_QUEUE_DEPTH_METRICS = tuple(
+    (metric_name, param_name, metric_name.replace('_', ' ').title(), _render_count)
+    for metric_name, param_name in _RAW_QUEUE_DEPTH_METRICS
+)
+
+# Every agent field the check looks up must be declared in PoolData,
+# otherwise it would silently be reported as missing when msgspec is used
+if msgspec is not None:
+    _CHECKED_FIELDS = (
+        {'alloc', 'free', 'read_wait', 'write_wait', 'disk_read_wait', 'disk_write_wait'}
+        | {field_name for field_name, *_ in _METRIC_PLAN}
+        | {field_name for field_name, *_ in _QUEUE_WAIT_METRICS}
+        | {metric_name for metric_name, _ in _RAW_QUEUE_DEPTH_METRICS}
+    )
+    assert _CHECKED_FIELDS <= set(PoolData.__struct_fields__), (
+        f"PoolData lacks fields: {sorted(_CHECKED_FIELDS - set(PoolData.__struct_fields__))}"
+    )
+
+def _levels_upper(params: Mapping[str, Any], key: str) -> Any:
     """
-    Extract levels from parameter in various formats.
-    
-    SimpleLevels produces:
-    - ("fixed", (warn, crit)) - fixed levels
-    - None - when not configured
+    Return the configured upper levels for a parameter, or None.
     
-    This function is now simplified since SimpleLevels already produces
-    the correct format for check_levels().
+    SimpleLevels produces ("fixed", (warn, crit)) when levels are set and
+    ("no_levels", None) when the user explicitly disabled them. Both are
+    passed on unchanged, so check_levels() still reports the value for
+    disabled levels; only an unset parameter yields None.
     
     Args:
-        levels_param: Levels parameter from ruleset
+        params: Check parameters from ruleset
+        key: Name of the levels parameter
         
     Returns:
-        Levels parameter directly (already in correct format) or None
+        Levels parameter in check_levels() format, or None
     """
-    # SimpleLevels already produces the correct format, just return it
-    return levels_param
+    return params.get(key) or None
+
+def _ns_to_seconds(value_ns: Optional[float]) -> Optional[float]:
+    """
+    Convert a ZFS wait time from nanoseconds to seconds.
+    
+    Missing (None) and zero values are passed through unchanged.
+    """
+    return value_ns / 1e9 if value_ns else value_ns
 
 def _convert_ms_levels_to_seconds(levels_param):
     """
@@ -81,59 +268,236 @@ def _convert_ms_levels_to_seconds(levels_param):
     # Return as-is for other formats (predictive, no_levels, etc.)
     return levels_param
 
-def _check_wait_time_metric(
+@lru_cache(maxsize=64)
+def _cached_ms_levels_to_seconds(levels_param):
+    """Memoized _convert_ms_levels_to_seconds for hashable level tuples."""
+    return _convert_ms_levels_to_seconds(levels_param)
+
+def _seconds_levels(levels_param):
+    """
+    Convert millisecond levels to seconds, reusing earlier conversions.
+    
+    The configured levels rarely change between check cycles, so the
+    converted tuples are cached by value. Unhashable levels (e.g. from
+    predictive level specs) are converted without caching.
+    
+    Args:
+        levels_param: Levels parameter with millisecond values
+        
+    Returns:
+        Levels parameter with values converted to seconds, or None
+    """
+    try:
+        return _cached_ms_levels_to_seconds(levels_param)
+    except TypeError:
+        return _convert_ms_levels_to_seconds(levels_param)
+
+def _emit(
+    value: float,
+    levels: Any,
+    metric_name: str,
+    label: str,
+    render_func: Callable[[float], str]
+) -> CheckResult:
+    """
+    Check a value against optional upper levels.
+    
+    Without levels only the metric is reported, so no Result is produced.
+    
+    Args:
+        value: Measured value
+        levels: Upper levels from the ruleset, or None
+        metric_name: Name for the metric
+        label: Human-readable label for check output
+        render_func: Function rendering the value for check output
+        
+    Yields:
+        Check results and metrics
+    """
+    if not levels:
+        yield Metric(metric_name, value)
+        return
+    
+    yield from check_levels(
+        value,
+        levels_upper=levels,
+        metric_name=metric_name,
+        label=label,
+        render_func=render_func,
+    )
+
+def _wait_time_results(
     value_ns: Optional[float],
     levels_param: Any,
     metric_name: str,
     label: str
-) -> CheckResult:
+) -> List[Union[Result, Metric]]:
     """
     Helper function to consistently handle wait time metrics.
     
+    Returns a list rather than yielding, which avoids a generator frame
+    per wait metric on every check.
+    
     Args:
         value_ns: Raw value in nanoseconds from zpool iostat (None if metric doesn't exist)
         levels_param: Levels parameter from ruleset (in milliseconds)
-        metric_name: Name for the metric (will have _s suffix added)
+        metric_name: Name for the metric in seconds (with _s suffix)
         label: Human-readable label for check output
         
-    Yields:
+    Returns:
         Check results and metrics
     """
     # Handle missing metrics
     if value_ns is None:
-        yield Metric(metric_name + "_s", float('nan'))
-        return
+        return [_missing_metric(metric_name)]
     
     # Convert from nanoseconds to seconds
-    value_s = value_ns / 1e9 if value_ns != 0 else 0
+    value_s = _ns_to_seconds(value_ns)
     
     # Convert levels if configured
     if levels_param:
         # Convert millisecond thresholds to seconds
-        levels_in_seconds = _convert_ms_levels_to_seconds(levels_param)
-        yield from check_levels(
+        levels_in_seconds = _seconds_levels(levels_param)
+        return list(check_levels(
             value_s,
             levels_upper=levels_in_seconds,
-            metric_name=metric_name + "_s",
+            metric_name=metric_name,
             label=label,
             render_func=_render_milliseconds,
-        )
-    else:
-        # Always yield metric for graph display
-        yield Metric(metric_name + "_s", value_s)
+        ))
+    
+    # Always report metric for graph display
+    return [Metric(metric_name, value_s)]
+
+
+def _decode_pool(json_data: str) -> Any:
+    """Decode a single pool payload, into a PoolData struct if possible."""
+    if msgspec is not None:
+        try:
+            return _decode_pool_struct(json_data)
+        except msgspec.ValidationError:
+            # Not a pool object, let the generic decoder report it
+            pass
+    return _loads(json_data)
+
+def _decode_all_pools(json_data: str) -> Any:
+    """Decode the combined payload, into PoolData structs if possible."""
+    if msgspec is not None:
+        try:
+            return _decode_all_pool_structs(json_data)
+        except msgspec.ValidationError:
+            # Unexpected structure, let the generic decoder report it
+            pass
+    return _loads(json_data)
+
+def _collect_pools(items: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the section from (pool name, pool data) pairs.
+    
+    Args:
+        items: Decoded pool entries of the combined agent payload
+        
+    Returns:
+        Dictionary with pool names as keys and metrics as values
+    """
+    return {
+        pool_name: pool_data if isinstance(pool_data, _POOL_DATA_TYPES) else {'_error': 'Invalid JSON structure'}
+        for pool_name, pool_data in items
+    }
 
+def _parse_all_pools(json_data: str) -> Dict[str, Any]:
+    """
+    Parse the combined agent payload holding all pools in one JSON document.
+    
+    Args:
+        json_data: JSON object mapping pool names to their metrics
+        
+    Returns:
+        Dictionary with pool names as keys and metrics as values
+    """
+    if len(json_data) > _MAX_PAYLOAD_SIZE:
+        return {'_parse_error': f'Payload too large ({len(json_data)} characters)'}
+    
+    try:
+        all_pools = _decode_all_pools(json_data)
+    except _JSON_DECODE_ERRORS as e:
+        return {'_parse_error': f'JSON parsing failed: {str(e)}'}
+    except Exception as e:
+        return {'_parse_error': f'Unexpected error: {str(e)}'}
+    
+    if not isinstance(all_pools, dict):
+        return {'_parse_error': 'Invalid JSON structure'}
+    
+    return _collect_pools(all_pools.items())
+
+def _parse_pool_line(pool_name: str, json_data: str) -> Any:
+    """
+    Parse the payload of a single pool line of older agents.
+    
+    Args:
+        pool_name: Pool name the payload belongs to
+        json_data: JSON payload of the pool
+        
+    Returns:
+        Pool metrics, or a dict with an '_error' entry
+    """
+    if len(json_data) > _MAX_PAYLOAD_SIZE:
+        return {'_error': f'Payload too large ({len(json_data)} characters)'}
+    
+    try:
+        # Parse JSON payload
+        pool_data = _decode_pool(json_data)
+    except _JSON_DECODE_ERRORS as e:
+        return {'_error': f'JSON parsing failed: {str(e)}'}
+    except Exception as e:
+        return {'_error': f'Unexpected error: {str(e)}'}
+    
+    # Validate that we have the expected structure
+    if isinstance(pool_data, _POOL_DATA_TYPES):
+        return pool_data
+    return {'_error': 'Invalid JSON structure'}
+
+def _parse_pool_lines(pool_lines: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """
+    Parse per-pool payloads of older agents one line at a time.
+    
+    Args:
+        pool_lines: (pool name, JSON payload) pairs
+        
+    Returns:
+        Dictionary with pool names as keys and metrics as values
+    """
+    return {
+        pool_name: _parse_pool_line(pool_name, json_data)
+        for pool_name, json_data in pool_lines
+    }
 
 def parse_oposs_zpool_iostat(string_table: List[List[str]]) -> Dict[str, Any]:
     """
     Parse oposs_zpool_iostat agent data from JSON format.
     
+    Current agents emit a single line with all pools in one JSON document,
+    so the whole section is decoded with one call. Older agents emit one
+    line per pool; those payloads are decoded line by line so that errors
+    are reported on the affected pool only.
+    
     Args:
         string_table: Raw agent data as list of lines split by separator
         
     Returns:
         Dictionary with pool names as keys and metrics as values
     """
+    # Fast path for the common single line case: the combined payload of
+    # current agents, or an older agent reporting a single pool
+    if len(string_table) == 1 and len(string_table[0]) >= 2:
+        item, json_data = string_table[0][0], string_table[0][1]
+        if item == _ALL_POOLS_MARKER:
+            return _parse_all_pools(json_data)
+        if item != "ERROR":
+            return _parse_pool_lines([(item, json_data)])
+    
     pools = {}
+    pool_lines = []
     
     for line in string_table:
         if len(line) < 2:
@@ -144,25 +508,12 @@ def parse_oposs_zpool_iostat(string_table: List[List[str]]) -> Dict[str, Any]:
             error_msg = line[1] if len(line) > 1 else "Unknown error"
             pools['_parse_error'] = error_msg
             continue
-            
-        # Extract pool name and JSON data
-        pool_name = line[0]
-        json_data = line[1]
         
-        try:
-            # Parse JSON payload
-            pool_data = json.loads(json_data)
-            
-            # Validate that we have the expected structure
-            if isinstance(pool_data, dict):
-                pools[pool_name] = pool_data
-            else:
-                pools[pool_name] = {'_error': 'Invalid JSON structure'}
-                
-        except json.JSONDecodeError as e:
-            pools[pool_name] = {'_error': f'JSON parsing failed: {str(e)}'}
-        except Exception as e:
-            pools[pool_name] = {'_error': f'Unexpected error: {str(e)}'}
+        pool_lines.append((line[0], line[1]))
+    
+    # Each payload is decoded on its own so that a malformed line is
+    # reported on its pool and cannot leak into its neighbours
+    pools.update(_parse_pool_lines(pool_lines))
     
     return pools
 
@@ -182,10 +533,21 @@ def discover_oposs_zpool_iostat(section: Dict[str, Any]) -> DiscoveryResult:
     Yields:
         Service objects for each discovered pool
     """
-    # Skip error pools and metadata
+    # Nothing can be discovered from a section that failed to parse
+    if '_parse_error' in section:
+        return
+    
+    # Skip error pools and metadata. Pool data always comes straight from
+    # the decoder, so an exact type check is sufficient.
     for pool_name, pool_data in section.items():
-        if not pool_name.startswith('_') and isinstance(pool_data, dict) and '_error' not in pool_data:
-            yield Service(item=pool_name)
+        if pool_name[:1] == '_':
+            continue
+        if type(pool_data) is dict:
+            if '_error' in pool_data:
+                continue
+        elif type(pool_data) not in _POOL_DATA_TYPES:
+            continue
+        yield Service(item=pool_name)
 
 def check_oposs_zpool_iostat(
     item: str, 
@@ -221,33 +583,51 @@ def check_oposs_zpool_iostat(
     
     pool_data = section[item]
     
-    # Handle pool-specific errors
-    if '_error' in pool_data:
+    # Handle pool-specific errors (only ever reported as dicts)
+    is_dict = type(pool_data) is dict
+    if is_dict and '_error' in pool_data:
         yield Result(
             state=State.UNKNOWN,
             summary=f"Pool {item} error: {pool_data['_error']}"
         )
         return
     
-    # Extract basic metrics
-    read_ops = pool_data.get('read_ops', 0)
-    write_ops = pool_data.get('write_ops', 0)
-    read_bytes = pool_data.get('read_bytes', 0)
-    write_bytes = pool_data.get('write_bytes', 0)
-    
+    # Bind the lookup functions and frequently used globals once, they are
+    # used throughout the check. PoolData structs provide the same lookups
+    # through getattr(), returning the default for undeclared fields just
+    # like dict.get() does for missing keys.
+    pget = params.get
+    _Metric = Metric
+    _check_levels = check_levels
+    _missing = _missing_metric
+    
+    # Resolve the configured levels once. Most setups only configure
+    # storage_levels, so the remaining parameters are never looked at again.
+    # Queue depth levels live in the queue_thresholds sub-dictionary; rules
+    # saved before it existed keep them at the top level.
+    active = {}
+    for levels_params in (params, pget(_QUEUE_THRESHOLDS) or {}):
+        for param_name in levels_params:
+            if param_name == _QUEUE_THRESHOLDS:
+                continue
+            levels = _levels_upper(levels_params, param_name)
+            if levels:
+                active[param_name] = levels
+    aget = active.get
+    dget = pool_data.get if is_dict else lambda key, default=None: getattr(pool_data, key, default)
     
     # Storage capacity metrics
-    alloc = pool_data.get('alloc', 0)
-    free = pool_data.get('free', 0)
+    alloc = dget('alloc', 0)
+    free = dget('free', 0)
     total = alloc + free
     
     if total > 0:
         used_percent = (alloc / total) * 100
         
         # Check storage levels using check_levels function
-        levels_upper = params.get('storage_levels')
+        levels_upper = pget('storage_levels')
             
-        yield from check_levels(
+        yield from _check_levels(
             used_percent,
             levels_upper=levels_upper,
             metric_name="storage_used_percent",
@@ -256,164 +636,88 @@ def check_oposs_zpool_iostat(
             render_func=render.percent,
         )
     
-    # I/O Operation metrics and levels
-    read_ops_levels = params.get('read_ops_levels')
-    if read_ops_levels:
-        yield from check_levels(
-            read_ops,
-            levels_upper=read_ops_levels,
-            metric_name="read_ops",
-            label="Read operations",
-            render_func=_render_operations_per_second,
-        )
-    else:
-        yield Metric("read_ops", read_ops)
-    
-    write_ops_levels = params.get('write_ops_levels')
-    if write_ops_levels:
-        yield from check_levels(
-            write_ops,
-            levels_upper=write_ops_levels,
-            metric_name="write_ops", 
-            label="Write operations",
-            render_func=_render_operations_per_second,
-        )
-    else:
-        yield Metric("write_ops", write_ops)
-    
-    # Throughput metrics and levels
-    read_throughput_levels = params.get('read_throughput_levels')
-    if read_throughput_levels:
-        yield from check_levels(
-            read_bytes,
-            levels_upper=read_throughput_levels,
-            metric_name="read_throughput",
-            label="Read throughput",
-            render_func=render.bytes,
-        )
-    else:
-        yield Metric("read_throughput", read_bytes)
-        
-    write_throughput_levels = params.get('write_throughput_levels')
-    if write_throughput_levels:
-        yield from check_levels(
-            write_bytes,
-            levels_upper=write_throughput_levels,
-            metric_name="write_throughput",
-            label="Write throughput",
-            render_func=render.bytes,
-        )
-    else:
-        yield Metric("write_throughput", write_bytes)
+    # I/O operation and throughput metrics and levels
+    for field_name, metric_name, param_name, label, render_func in _METRIC_PLAN:
+        yield from _emit(dget(field_name, 0), aget(param_name), metric_name, label, render_func)
     
     # Storage metrics
-    yield Metric("allocated", alloc)
-    yield Metric("free", free)
+    yield _Metric("allocated", alloc)
+    yield _Metric("free", free)
     
     # Wait time metrics and levels
-    yield from _check_wait_time_metric(
-        pool_data.get('read_wait'),
-        params.get('read_wait_levels'),
-        "read_wait",
+    yield from _wait_time_results(
+        dget('read_wait'),
+        aget('read_wait_levels'),
+        _READ_WAIT_S,
         "Read wait time"
     )
     
-    yield from _check_wait_time_metric(
-        pool_data.get('write_wait'),
-        params.get('write_wait_levels'),
-        "write_wait",
+    yield from _wait_time_results(
+        dget('write_wait'),
+        aget('write_wait_levels'),
+        _WRITE_WAIT_S,
         "Write wait time"
     )
     
-    # Disk-level wait times
-    yield from _check_wait_time_metric(
-        pool_data.get('disk_read_wait'),
-        None,  # No individual levels for disk_read_wait
-        "disk_read_wait",
-        "Disk read wait time"
-    )
+    # Disk-level wait times: convert each value once and reuse the seconds
+    # for the combined maximum instead of going through the helper again
+    disk_read_wait_ns = dget('disk_read_wait')
+    disk_write_wait_ns = dget('disk_write_wait')
+    disk_read_wait_s = _ns_to_seconds(disk_read_wait_ns)
+    disk_write_wait_s = _ns_to_seconds(disk_write_wait_ns)
     
-    yield from _check_wait_time_metric(
-        pool_data.get('disk_write_wait'),
-        None,  # No individual levels for disk_write_wait
-        "disk_write_wait",
-        "Disk write wait time"
-    )
+    yield _missing(_DISK_READ_WAIT_S) if disk_read_wait_s is None else _Metric(_DISK_READ_WAIT_S, disk_read_wait_s)
+    yield _missing(_DISK_WRITE_WAIT_S) if disk_write_wait_s is None else _Metric(_DISK_WRITE_WAIT_S, disk_write_wait_s)
     
     # Check combined disk wait levels if configured
-    disk_wait_levels = params.get('disk_wait_levels')
-    if disk_wait_levels:
-        disk_read_wait_ns = pool_data.get('disk_read_wait')
-        disk_write_wait_ns = pool_data.get('disk_write_wait')
-        
-        # Only compute max if both values exist
-        if disk_read_wait_ns is not None and disk_write_wait_ns is not None:
-            max_disk_wait_ns = max(disk_read_wait_ns, disk_write_wait_ns)
-            if max_disk_wait_ns > 0:
-                # Use helper function for consistent handling
-                yield from _check_wait_time_metric(
-                    max_disk_wait_ns,
-                    params.get('disk_wait_levels'),
-                    "disk_wait_max",
-                    "Disk wait time"
-                )
+    disk_wait_levels = aget('disk_wait_levels')
+    if disk_wait_levels and disk_read_wait_s is not None and disk_write_wait_s is not None:
+        max_disk_wait_s = max(disk_read_wait_s, disk_write_wait_s)
+        if max_disk_wait_s > 0:
+            yield from _check_levels(
+                max_disk_wait_s,
+                levels_upper=_seconds_levels(disk_wait_levels),
+                metric_name=_DISK_WAIT_MAX_S,
+                label="Disk wait time",
+                render_func=_render_milliseconds,
+            )
     
     # Individual queue wait time metrics
-    queue_wait_metrics = [
-        ('syncq_read_wait', 'syncq_read_wait_levels', 'Sync Queue Read Wait'),
-        ('syncq_write_wait', 'syncq_write_wait_levels', 'Sync Queue Write Wait'),
-        ('asyncq_read_wait', 'asyncq_read_wait_levels', 'Async Queue Read Wait'),
-        ('asyncq_write_wait', 'asyncq_write_wait_levels', 'Async Queue Write Wait'),
-        ('scrub_wait', 'scrub_wait_levels', 'Scrub Wait'),
-        ('trim_wait', 'trim_wait_levels', 'Trim Wait'),
-        ('rebuild_wait', 'rebuild_wait_levels', 'Rebuild Wait')
-    ]
-    
-    for metric_name, param_name, label in queue_wait_metrics:
-        yield from _check_wait_time_metric(
-            pool_data.get(metric_name),
-            params.get(param_name),
+    for field_name, metric_name, param_name, label in _QUEUE_WAIT_METRICS:
+        yield from _wait_time_results(
+            dget(field_name),
+            aget(param_name),
             metric_name,
             label
         )
     
     # Individual queue depth metrics
-    queue_depth_metrics = [
-        ('syncq_read_pend', 'syncq_read_pend_levels'),
-        ('syncq_read_activ', 'syncq_read_activ_levels'),
-        ('syncq_write_pend', 'syncq_write_pend_levels'),
-        ('syncq_write_activ', 'syncq_write_activ_levels'),
-        ('asyncq_read_pend', 'asyncq_read_pend_levels'),
-        ('asyncq_read_activ', 'asyncq_read_activ_levels'),
-        ('asyncq_write_pend', 'asyncq_write_pend_levels'),
-        ('asyncq_write_activ', 'asyncq_write_activ_levels'),
-        ('scrubq_read_pend', 'scrubq_read_pend_levels'),
-        ('scrubq_read_activ', 'scrubq_read_activ_levels'),
-        ('trimq_write_pend', 'trimq_write_pend_levels'),
-        ('trimq_write_activ', 'trimq_write_activ_levels'),
-        ('rebuildq_write_pend', 'rebuildq_write_pend_levels'),
-        ('rebuildq_write_activ', 'rebuildq_write_activ_levels')
-    ]
-    
-    for metric_name, param_name in queue_depth_metrics:
-        value = pool_data.get(metric_name)
+    for metric_name, param_name, label, render_func in _QUEUE_DEPTH_METRICS:
+        value = dget(metric_name)
         
         # Always yield metric, even if NaN (for graph display)
         if value is None:
-            yield Metric(metric_name, float('nan'))
+            yield _missing(metric_name)
             continue
             
-        levels_param = params.get(param_name)
+        levels_param = aget(param_name)
         if levels_param:
-            yield from check_levels(
+            yield from _check_levels(
                 value,
                 levels_upper=levels_param,
                 metric_name=metric_name,
-                label=metric_name.replace('_', ' ').title(),
-                render_func=_render_count,
+                label=label,
+                render_func=render_func,
             )
         else:
-            yield Metric(metric_name, value)
+            yield _Metric(metric_name, value)
+
+# Default check parameters, built once at import. Only storage levels have
+# a default; every other levels parameter is optional and simply absent
+# unless configured, which keeps the per-service parameter merge small.
+_DEFAULT_PARAMETERS = {
+    'storage_levels': ('fixed', (80.0, 90.0)),  # Default storage usage levels
+}
 
 # Create the check plugin
 check_plugin_oposs_zpool_iostat = CheckPlugin(
@@ -423,37 +727,5 @@ check_plugin_oposs_zpool_iostat = CheckPlugin(
     discovery_function=discover_oposs_zpool_iostat,
     check_function=check_oposs_zpool_iostat,
     check_ruleset_name="oposs_zpool_iostat",
-    check_default_parameters={
-        'storage_levels': ('fixed', (80.0, 90.0)),  # Default storage usage levels
-        'read_ops_levels': None,
-        'write_ops_levels': None,
-        'read_wait_levels': None,
-        'write_wait_levels': None,
-        'read_throughput_levels': None,
-        'write_throughput_levels': None,
-        'disk_wait_levels': None,
-        # Individual queue wait time levels
-        'syncq_read_wait_levels': None,
-        'syncq_write_wait_levels': None,
-        'asyncq_read_wait_levels': None,
-        'asyncq_write_wait_levels': None,
-        'scrub_wait_levels': None,
-        'trim_wait_levels': None,
-        'rebuild_wait_levels': None,
-        # Individual queue depth levels
-        'syncq_read_pend_levels': None,
-        'syncq_read_activ_levels': None,
-        'syncq_write_pend_levels': None,
-        'syncq_write_activ_levels': None,
-        'asyncq_read_pend_levels': None,
-        'asyncq_read_activ_levels': None,
-        'asyncq_write_pend_levels': None,
-        'asyncq_write_activ_levels': None,
-        'scrubq_read_pend_levels': None,
-        'scrubq_read_activ_levels': None,
-        'trimq_write_pend_levels': None,
-        'trimq_write_activ_levels': None,
-        'rebuildq_write_pend_levels': None,
-        'rebuildq_write_activ_levels': None,
-    },
+    check_default_parameters=_DEFAULT_PARAMETERS,
 )
\ No newline at end of file
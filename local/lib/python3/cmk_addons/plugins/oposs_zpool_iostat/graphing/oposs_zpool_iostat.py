@@ -4,6 +4,8 @@ CheckMK Graphing configuration for OPOSS zpool iostat monitoring
 Defines metrics, graphs, and perfometers using CheckMK 2.3 v1 graphing API
 """
 
+from functools import cache
+
 from cmk.graphing.v1 import Title
 from cmk.graphing.v1.metrics import (
     Color,
@@ -25,6 +27,10 @@ from cmk.graphing.v1.perfometers import (
     Stacked,
 )
 
+# Cached constructors so repeated titles and range bounds share one instance
+_title = cache(Title)
+_closed = cache(Closed)
+
 # Define units
 unit_ops_per_sec = Unit(DecimalNotation("/s"))
 unit_bytes_per_sec = Unit(IECNotation("B/s"))
@@ -33,390 +39,234 @@ unit_seconds = Unit(TimeNotation())  # Use TimeNotation for proper SI scaling (s
 unit_count = Unit(DecimalNotation(""))
 unit_percent = Unit(DecimalNotation("%"))
 
-# Storage capacity metrics
-metric_allocated = Metric(
-    name="allocated",
-    title=Title("Allocated space"),
-    unit=unit_bytes,
-    color=Color.BLUE,
-)
-
-metric_free = Metric(
-    name="free",
-    title=Title("Free space"),
-    unit=unit_bytes,
-    color=Color.GREEN,
-)
-
-metric_storage_used_percent = Metric(
-    name="storage_used_percent",
-    title=Title("Storage utilization"),
-    unit=unit_percent,
-    color=Color.ORANGE,
-)
-
-# I/O Operations metrics
-metric_read_ops = Metric(
-    name="read_ops",
-    title=Title("Read operations"),
-    unit=unit_ops_per_sec,
-    color=Color.CYAN,
-)
-
-metric_write_ops = Metric(
-    name="write_ops",
-    title=Title("Write operations"),
-    unit=unit_ops_per_sec,
-    color=Color.PURPLE,
-)
-
-# Throughput metrics
-metric_read_throughput = Metric(
-    name="read_throughput",
-    title=Title("Read throughput"),
-    unit=unit_bytes_per_sec,
-    color=Color.LIGHT_BLUE,
-)
-
-metric_write_throughput = Metric(
-    name="write_throughput",
-    title=Title("Write throughput"),
-    unit=unit_bytes_per_sec,
-    color=Color.LIGHT_PURPLE,
-)
-
-# Wait time metrics - now in seconds with _s suffix
-metric_read_wait_s = Metric(
-    name="read_wait_s",
-    title=Title("Read wait time"),
-    unit=unit_seconds,
-    color=Color.BLUE,
-)
-
-metric_write_wait_s = Metric(
-    name="write_wait_s",
-    title=Title("Write wait time"),
-    unit=unit_seconds,
-    color=Color.RED,
-)
-
-metric_disk_read_wait_s = Metric(
-    name="disk_read_wait_s",
-    title=Title("Disk read wait time"),
-    unit=unit_seconds,
-    color=Color.CYAN,
-)
-
-metric_disk_write_wait_s = Metric(
-    name="disk_write_wait_s",
-    title=Title("Disk write wait time"),
-    unit=unit_seconds,
-    color=Color.ORANGE,
-)
-
-metric_disk_wait_max_s = Metric(
-    name="disk_wait_max_s",
-    title=Title("Max disk wait time"),
-    unit=unit_seconds,
-    color=Color.DARK_RED,
-)
-
-# Queue wait time metrics - now in seconds with _s suffix
-metric_syncq_read_wait_s = Metric(
-    name="syncq_read_wait_s",
-    title=Title("Sync queue read wait time"),
-    unit=unit_seconds,
-    color=Color.GREEN,
-)
-
-metric_syncq_write_wait_s = Metric(
-    name="syncq_write_wait_s",
-    title=Title("Sync queue write wait time"),
-    unit=unit_seconds,
-    color=Color.YELLOW,
-)
-
-metric_asyncq_read_wait_s = Metric(
-    name="asyncq_read_wait_s",
-    title=Title("Async queue read wait time"),
-    unit=unit_seconds,
-    color=Color.PURPLE,
-)
-
-metric_asyncq_write_wait_s = Metric(
-    name="asyncq_write_wait_s",
-    title=Title("Async queue write wait time"),
-    unit=unit_seconds,
-    color=Color.PINK,
-)
-
-# Special operation wait times - now in seconds with _s suffix
-metric_scrub_wait_s = Metric(
-    name="scrub_wait_s",
-    title=Title("Scrub wait time"),
-    unit=unit_seconds,
-    color=Color.BROWN,
-)
-
-metric_trim_wait_s = Metric(
-    name="trim_wait_s",
-    title=Title("Trim wait time"),
-    unit=unit_seconds,
-    color=Color.GRAY,
-)
-
-metric_rebuild_wait_s = Metric(
-    name="rebuild_wait_s",
-    title=Title("Rebuild wait time"),
-    unit=unit_seconds,
-    color=Color.PINK,
-)
-
-# Queue depth metrics (pending operations)
-metric_syncq_read_pend = Metric(
-    name="syncq_read_pend",
-    title=Title("Sync queue read pending"),
-    unit=unit_count,
-    color=Color.LIGHT_GRAY,
-)
-
-metric_syncq_read_activ = Metric(
-    name="syncq_read_activ",
-    title=Title("Sync queue read active"),
-    unit=unit_count,
-    color=Color.GRAY,
-)
-
-metric_syncq_write_pend = Metric(
-    name="syncq_write_pend",
-    title=Title("Sync queue write pending"),
-    unit=unit_count,
-    color=Color.LIGHT_BROWN,
-)
-
-metric_syncq_write_activ = Metric(
-    name="syncq_write_activ",
-    title=Title("Sync queue write active"),
-    unit=unit_count,
-    color=Color.BROWN,
-)
-
-metric_asyncq_read_pend = Metric(
-    name="asyncq_read_pend",
-    title=Title("Async queue read pending"),
-    unit=unit_count,
-    color=Color.LIGHT_CYAN,
-)
-
-metric_asyncq_read_activ = Metric(
-    name="asyncq_read_activ",
-    title=Title("Async queue read active"),
-    unit=unit_count,
-    color=Color.DARK_CYAN,
-)
-
-metric_asyncq_write_pend = Metric(
-    name="asyncq_write_pend",
-    title=Title("Async queue write pending"),
-    unit=unit_count,
-    color=Color.LIGHT_PINK,
-)
-
-metric_asyncq_write_activ = Metric(
-    name="asyncq_write_activ",
-    title=Title("Async queue write active"),
-    unit=unit_count,
-    color=Color.PINK,
-)
-
-# Special operation queue metrics
-metric_scrubq_read_pend = Metric(
-    name="scrubq_read_pend",
-    title=Title("Scrub queue read pending"),
-    unit=unit_count,
-    color=Color.LIGHT_PURPLE,
-)
-
-metric_scrubq_read_activ = Metric(
-    name="scrubq_read_activ",
-    title=Title("Scrub queue read active"),
-    unit=unit_count,
-    color=Color.PURPLE,
-)
-
-metric_trimq_write_pend = Metric(
-    name="trimq_write_pend",
-    title=Title("Trim queue write pending"),
-    unit=unit_count,
-    color=Color.LIGHT_BLUE,
-)
-
-metric_trimq_write_activ = Metric(
-    name="trimq_write_activ",
-    title=Title("Trim queue write active"),
-    unit=unit_count,
-    color=Color.DARK_BLUE,
-)
-
-metric_rebuildq_write_pend = Metric(
-    name="rebuildq_write_pend",
-    title=Title("Rebuild queue write pending"),
-    unit=unit_count,
-    color=Color.LIGHT_PURPLE,
-)
-
-metric_rebuildq_write_activ = Metric(
-    name="rebuildq_write_activ",
-    title=Title("Rebuild queue write active"),
-    unit=unit_count,
-    color=Color.PURPLE,
-)
+# Shared ranges - capacity uses 1 TiB to match the IEC byte unit
+_CAPACITY_LIMIT = 1 << 40
+_CAP_RANGE = MinimalRange(lower=0, upper=_CAPACITY_LIMIT)
+_OPS_RANGE = MinimalRange(lower=0, upper=1000)
+_WAIT_RANGE = MinimalRange(lower=0, upper=0.001)  # 1ms - typical for fast storage
+_QUEUE_RANGE = MinimalRange(lower=0, upper=100)  # 100 operations
+_OPS_FOCUS = FocusRange(lower=_closed(0), upper=_closed(1000))
+_CAP_FOCUS = FocusRange(lower=_closed(0), upper=_closed(_CAPACITY_LIMIT))
+
+# Metric definitions: (name, title, unit, color)
+_METRICS = (
+    # Storage capacity metrics
+    ("allocated", "Allocated space", unit_bytes, Color.BLUE),
+    ("free", "Free space", unit_bytes, Color.GREEN),
+    ("storage_used_percent", "Storage utilization", unit_percent, Color.ORANGE),
+
+    # I/O Operations metrics
+    ("read_ops", "Read operations", unit_ops_per_sec, Color.CYAN),
+    ("write_ops", "Write operations", unit_ops_per_sec, Color.PURPLE),
+
+    # Throughput metrics
+    ("read_throughput", "Read throughput", unit_bytes_per_sec, Color.LIGHT_BLUE),
+    ("write_throughput", "Write throughput", unit_bytes_per_sec, Color.LIGHT_PURPLE),
+
+    # Wait time metrics - now in seconds with _s suffix
+    ("read_wait_s", "Read wait time", unit_seconds, Color.BLUE),
+    ("write_wait_s", "Write wait time", unit_seconds, Color.RED),
+    ("disk_read_wait_s", "Disk read wait time", unit_seconds, Color.CYAN),
+    ("disk_write_wait_s", "Disk write wait time", unit_seconds, Color.ORANGE),
+    ("disk_wait_max_s", "Max disk wait time", unit_seconds, Color.DARK_RED),
+
+    # Queue wait time metrics - now in seconds with _s suffix
+    ("syncq_read_wait_s", "Sync queue read wait time", unit_seconds, Color.GREEN),
+    ("syncq_write_wait_s", "Sync queue write wait time", unit_seconds, Color.YELLOW),
+    ("asyncq_read_wait_s", "Async queue read wait time", unit_seconds, Color.PURPLE),
+    ("asyncq_write_wait_s", "Async queue write wait time", unit_seconds, Color.PINK),
+
+    # Special operation wait times - now in seconds with _s suffix
+    ("scrub_wait_s", "Scrub wait time", unit_seconds, Color.BROWN),
+    ("trim_wait_s", "Trim wait time", unit_seconds, Color.GRAY),
+    ("rebuild_wait_s", "Rebuild wait time", unit_seconds, Color.PINK),
+
+    # Queue depth metrics (pending operations)
+    ("syncq_read_pend", "Sync queue read pending", unit_count, Color.LIGHT_GRAY),
+    ("syncq_read_activ", "Sync queue read active", unit_count, Color.GRAY),
+    ("syncq_write_pend", "Sync queue write pending", unit_count, Color.LIGHT_BROWN),
+    ("syncq_write_activ", "Sync queue write active", unit_count, Color.BROWN),
+    ("asyncq_read_pend", "Async queue read pending", unit_count, Color.LIGHT_CYAN),
+    ("asyncq_read_activ", "Async queue read active", unit_count, Color.DARK_CYAN),
+    ("asyncq_write_pend", "Async queue write pending", unit_count, Color.LIGHT_PINK),
+    ("asyncq_write_activ", "Async queue write active", unit_count, Color.PINK),
+
+    # Special operation queue metrics
+    ("scrubq_read_pend", "Scrub queue read pending", unit_count, Color.LIGHT_PURPLE),
+    ("scrubq_read_activ", "Scrub queue read active", unit_count, Color.PURPLE),
+    ("trimq_write_pend", "Trim queue write pending", unit_count, Color.LIGHT_BLUE),
+    ("trimq_write_activ", "Trim queue write active", unit_count, Color.DARK_BLUE),
+    ("rebuildq_write_pend", "Rebuild queue write pending", unit_count, Color.LIGHT_PURPLE),
+    ("rebuildq_write_activ", "Rebuild queue write active", unit_count, Color.PURPLE),
+)
+
+# Register each metric as a module-level metric_<name> object, which is how
+# CheckMK discovers graphing plugins
+for _name, _metric_title, _unit, _color in _METRICS:
+    globals()[f"metric_{_name}"] = Metric(
+        name=_name,
+        title=_title(_metric_title),
+        unit=_unit,
+        color=_color,
+    )
+del _name, _metric_title, _unit, _color
 
 # Define graphs - organized into 5 logical groups
 
 # 1. Capacity - Storage allocation and usage
 graph_zpool_capacity = Graph(
     name="zpool_capacity",
-    title=Title("ZFS Pool Capacity"),
+    title=_title("ZFS Pool Capacity"),
     simple_lines=[
         "allocated",
         "free",
     ],
-    minimal_range=MinimalRange(
-        lower=0,
-        upper=1000000000000,  # 1TB default upper limit
-    ),
+    minimal_range=_CAP_RANGE,
 )
 
 # 2. Operations - Read/write operations per second
 graph_zpool_operations = Graph(
     name="zpool_operations",
-    title=Title("ZFS Pool Operations"),
+    title=_title("ZFS Pool Operations"),
     simple_lines=[
         "read_ops",
         "write_ops",
     ],
-    minimal_range=MinimalRange(
-        lower=0,
-        upper=1000,
-    ),
+    minimal_range=_OPS_RANGE,
 )
 
 # 3. Bandwidth - Read/write throughput
 graph_zpool_bandwidth = Bidirectional(
     name="zpool_bandwidth",
-    title=Title("ZFS Pool Bandwidth"),
+    title=_title("ZFS Pool Bandwidth"),
     lower=Graph(
         name="zpool_bandwidth_read",
-        title=Title("Read Bandwidth"),
+        title=_title("Read Bandwidth"),
         simple_lines=["read_throughput"],
     ),
     upper=Graph(
         name="zpool_bandwidth_write", 
-        title=Title("Write Bandwidth"),
+        title=_title("Write Bandwidth"),
         simple_lines=["write_throughput"],
     ),
 )
 
-# 4. Wait Times - Combined graph for all working wait time metrics
+# 4. Wait Times - one graph per wait time group, all metrics optional so a
+# graph still displays when the pool does not report some of them
+
+_TOTAL_WAIT_LINES = (
+    "read_wait_s",
+    "write_wait_s",
+)
+graph_zpool_total_wait = Graph(
+    name="zpool_total_wait",
+    title=_title("ZFS Pool Total Wait Times"),
+    simple_lines=_TOTAL_WAIT_LINES,
+    optional=_TOTAL_WAIT_LINES,
+    minimal_range=_WAIT_RANGE,
+)
 
-graph_zpool_wait_times = Graph(
-    name="zpool_wait_times",
-    title=Title("ZFS Pool Wait Times"),
-    simple_lines=[
-        # Total wait times
-        "read_wait_s",
-        "write_wait_s",
-        # Disk wait times
-        "disk_read_wait_s",
-        "disk_write_wait_s",
-        # Sync queue wait times
-        "syncq_read_wait_s",
-        "syncq_write_wait_s",
-        # Async queue wait times
-        "asyncq_read_wait_s",
-        "asyncq_write_wait_s",
-        # Special operation wait times
-        "scrub_wait_s",
-        "trim_wait_s",
-        "rebuild_wait_s",
-    ],
-    optional=[
-        # All metrics are optional - graph displays even if some are missing
-        "read_wait_s",
-        "write_wait_s",
-        "disk_read_wait_s",
-        "disk_write_wait_s",
-        "syncq_read_wait_s",
-        "syncq_write_wait_s",
-        "asyncq_read_wait_s",
-        "asyncq_write_wait_s",
-        "scrub_wait_s",
-        "trim_wait_s",
-        "rebuild_wait_s",
-    ],
-    minimal_range=MinimalRange(
-        lower=0,
-        upper=0.001,  # 1ms upper limit - typical for fast storage
-    ),
+_DISK_WAIT_LINES = (
+    "disk_read_wait_s",
+    "disk_write_wait_s",
+)
+graph_zpool_disk_wait = Graph(
+    name="zpool_disk_wait",
+    title=_title("ZFS Pool Disk Wait Times"),
+    simple_lines=_DISK_WAIT_LINES,
+    optional=_DISK_WAIT_LINES,
+    minimal_range=_WAIT_RANGE,
 )
 
-# 5. Task Queues - Combined graph for sync and async queues
+_QUEUE_WAIT_LINES = (
+    "syncq_read_wait_s",
+    "syncq_write_wait_s",
+    "asyncq_read_wait_s",
+    "asyncq_write_wait_s",
+)
+graph_zpool_queue_wait = Graph(
+    name="zpool_queue_wait",
+    title=_title("ZFS Pool Queue Wait Times"),
+    simple_lines=_QUEUE_WAIT_LINES,
+    optional=_QUEUE_WAIT_LINES,
+    minimal_range=_WAIT_RANGE,
+)
 
-graph_zpool_queue_depths = Graph(
-    name="zpool_queue_depths",
-    title=Title("ZFS Pool Queue Depths"),
-    simple_lines=[
-        # Sync queue depths
-        "syncq_read_pend",
-        "syncq_read_activ",
-        "syncq_write_pend",
-        "syncq_write_activ",
-        # Async queue depths
-        "asyncq_read_pend",
-        "asyncq_read_activ",
-        "asyncq_write_pend",
-        "asyncq_write_activ",
-        # Scrub queue depths  
-        "scrubq_read_pend",
-        "scrubq_read_activ",
-        # Trim queue depths (will be NaN until agent is updated)
-        "trimq_write_pend",
-        "trimq_write_activ",
-        # Rebuild queue depths (will be NaN until agent is updated)
-        "rebuildq_write_pend",
-        "rebuildq_write_activ",
-    ],
-    optional=[
-        # All metrics are optional - graph displays even if some are missing
-        "syncq_read_pend",
-        "syncq_read_activ",
-        "syncq_write_pend",
-        "syncq_write_activ",
-        "asyncq_read_pend",
-        "asyncq_read_activ",
-        "asyncq_write_pend",
-        "asyncq_write_activ",
-        "scrubq_read_pend",
-        "scrubq_read_activ",
-        "trimq_write_pend",
-        "trimq_write_activ",
-        "rebuildq_write_pend",
-        "rebuildq_write_activ",
-    ],
-    minimal_range=MinimalRange(
-        lower=0,
-        upper=100,  # 100 operations upper limit
-    ),
+_SPECIAL_WAIT_LINES = (
+    "scrub_wait_s",
+    "trim_wait_s",
+    "rebuild_wait_s",
+)
+graph_zpool_special_wait = Graph(
+    name="zpool_special_wait",
+    title=_title("ZFS Pool Scrub/Trim/Rebuild Wait Times"),
+    simple_lines=_SPECIAL_WAIT_LINES,
+    optional=_SPECIAL_WAIT_LINES,
+    minimal_range=_WAIT_RANGE,
+)
+
+# 5. Task Queues - sync, async, scrub and trim/rebuild queues in separate graphs
+
+_SYNCQ_DEPTH_LINES = (
+    "syncq_read_pend",
+    "syncq_read_activ",
+    "syncq_write_pend",
+    "syncq_write_activ",
+)
+graph_zpool_syncq_depths = Graph(
+    name="zpool_syncq_depths",
+    title=_title("ZFS Pool Sync Queue Depths"),
+    simple_lines=_SYNCQ_DEPTH_LINES,
+    optional=_SYNCQ_DEPTH_LINES,
+    minimal_range=_QUEUE_RANGE,
+)
+
+_ASYNCQ_DEPTH_LINES = (
+    "asyncq_read_pend",
+    "asyncq_read_activ",
+    "asyncq_write_pend",
+    "asyncq_write_activ",
+)
+graph_zpool_asyncq_depths = Graph(
+    name="zpool_asyncq_depths",
+    title=_title("ZFS Pool Async Queue Depths"),
+    simple_lines=_ASYNCQ_DEPTH_LINES,
+    optional=_ASYNCQ_DEPTH_LINES,
+    minimal_range=_QUEUE_RANGE,
+)
+
+_SCRUBQ_DEPTH_LINES = (
+    "scrubq_read_pend",
+    "scrubq_read_activ",
+)
+graph_zpool_scrubq_depths = Graph(
+    name="zpool_scrubq_depths",
+    title=_title("ZFS Pool Scrub Queue Depths"),
+    simple_lines=_SCRUBQ_DEPTH_LINES,
+    optional=_SCRUBQ_DEPTH_LINES,
+    minimal_range=_QUEUE_RANGE,
+)
+
+# Trim and rebuild queues are only reported by newer ZFS versions, so they get
+# their own graph instead of adding empty series to the other queue graphs
+_TRIM_REBUILD_DEPTH_LINES = (
+    "trimq_write_pend",
+    "trimq_write_activ",
+    "rebuildq_write_pend",
+    "rebuildq_write_activ",
+)
+graph_zpool_trim_rebuild_depths = Graph(
+    name="zpool_trim_rebuild_depths",
+    title=_title("ZFS Pool Trim/Rebuild Queue Depths"),
+    simple_lines=_TRIM_REBUILD_DEPTH_LINES,
+    optional=_TRIM_REBUILD_DEPTH_LINES,
+    minimal_range=_QUEUE_RANGE,
 )
 
 # Define perfometers
 perfometer_zpool_operations = Perfometer(
     name="zpool_operations",
-    focus_range=FocusRange(
-        lower=Closed(0),
-        upper=Closed(1000),
-    ),
+    focus_range=_OPS_FOCUS,
     segments=[
         "read_ops",
         "write_ops",
@@ -425,10 +275,7 @@ perfometer_zpool_operations = Perfometer(
 
 perfometer_zpool_storage = Perfometer(
     name="zpool_storage",
-    focus_range=FocusRange(
-        lower=Closed(0),
-        upper=Closed(1000000000000),  # 1TB
-    ),
+    focus_range=_CAP_FOCUS,
     segments=[
         "allocated",
         "free",
@@ -438,8 +285,8 @@ perfometer_zpool_storage = Perfometer(
 perfometer_zpool_wait_times = Perfometer(
     name="zpool_wait_times",
     focus_range=FocusRange(
-        lower=Closed(0),
-        upper=Closed(0.1),  # 100ms in seconds
+        lower=_closed(0),
+        upper=_closed(0.1),  # 100ms in seconds
     ),
     segments=[
         "read_wait_s",
@@ -452,18 +299,12 @@ perfometer_zpool_comprehensive = Stacked(
     name="zpool_comprehensive",
     lower=Perfometer(
         name="zpool_ops_lower",
-        focus_range=FocusRange(
-            lower=Closed(0),
-            upper=Closed(1000),
-        ),
+        focus_range=_OPS_FOCUS,
         segments=["read_ops", "write_ops"],
     ),
     upper=Perfometer(
         name="zpool_storage_upper",
-        focus_range=FocusRange(
-            lower=Closed(0),
-            upper=Closed(1000000000000),  # 1TB
-        ),
+        focus_range=_CAP_FOCUS,
         segments=["allocated", "free"],
     ),
 )
\ No newline at end of file
@@ -4,9 +4,11 @@ CheckMK Ruleset for OPOSS zpool iostat monitoring parameters
 Provides GUI configuration interface for zpool iostat thresholds and monitoring options
 """
 
-from cmk.rulesets.v1 import Title, Help, Label
+from functools import cache
+from typing import Any, Dict, Tuple
+
+from cmk.rulesets.v1 import Title, Help
 from cmk.rulesets.v1.form_specs import (
-    BooleanChoice,
     DefaultValue,
     DictElement,
     Dictionary,
@@ -22,14 +24,237 @@ from cmk.rulesets.v1.rule_specs import (
     Topic,
 )
 
+# Titles and help texts of the ruleset itself
+_T_RULESET = Title("OPOSS zpool iostat Ruleset")
+_T_ITEM = Title("ZPool name")
+_T_FORM = Title("OPOSS zpool iostat Ruleset Configuration")
+_H_FORM = Help(
+    "Configure thresholds and monitoring options for ZFS zpool I/O statistics. "
+    "This check monitors pool I/O operations, throughput, latency, and storage utilization."
+)
+_T_QUEUE = Title("Queue depth levels")
+_H_QUEUE = Help(
+    "Thresholds for the number of pending and active operations in the sync, async, "
+    "scrub, trim and rebuild queues."
+)
+
+# Validators are stateless, so every element shares these instances
+_MIN0_F = validators.NumberInRange(min_value=0.0)
+_MIN0_I = validators.NumberInRange(min_value=0)
+_PCT = validators.NumberInRange(min_value=0.0, max_value=100.0)
+
+# Appended to every wait time help text
+_MS_NOTE = (
+    "Note: Thresholds are configured in milliseconds for user convenience, "
+    "while internally the metrics are stored in seconds."
+)
+
+# Wait time thresholds: (key, title, help text, default levels in milliseconds)
+_MS_LEVELS = (
+    (
+        "read_wait_levels",
+        "Read wait time levels",
+        "Set warning and critical thresholds for read I/O wait times in milliseconds. "
+        "High wait times indicate storage performance issues. "
+        f"{_MS_NOTE}",
+        (50.0, 100.0),
+    ),
+    (
+        "write_wait_levels",
+        "Write wait time levels",
+        "Set warning and critical thresholds for write I/O wait times in milliseconds. "
+        "High wait times indicate storage performance issues. "
+        f"{_MS_NOTE}",
+        (100.0, 200.0),
+    ),
+    (
+        "disk_wait_levels",
+        "Disk I/O wait time levels",
+        "Set warning and critical thresholds for disk-level I/O wait times in milliseconds. "
+        "Monitors disk_read_wait and disk_write_wait metrics from zpool iostat. "
+        f"{_MS_NOTE}",
+        (20.0, 50.0),
+    ),
+    (
+        "syncq_read_wait_levels",
+        "Sync read queue wait time levels",
+        f"Thresholds for synchronous read queue wait times in milliseconds. {_MS_NOTE}",
+        (10.0, 25.0),
+    ),
+    (
+        "syncq_write_wait_levels",
+        "Sync write queue wait time levels",
+        f"Thresholds for synchronous write queue wait times in milliseconds. {_MS_NOTE}",
+        (10.0, 25.0),
+    ),
+    (
+        "asyncq_read_wait_levels",
+        "Async read queue wait time levels",
+        f"Thresholds for asynchronous read queue wait times in milliseconds. {_MS_NOTE}",
+        (5.0, 15.0),
+    ),
+    (
+        "asyncq_write_wait_levels",
+        "Async write queue wait time levels",
+        f"Thresholds for asynchronous write queue wait times in milliseconds. {_MS_NOTE}",
+        (5.0, 15.0),
+    ),
+    (
+        "scrub_wait_levels",
+        "Scrub operation wait time levels",
+        f"Thresholds for scrub operation wait times in milliseconds. {_MS_NOTE}",
+        (50.0, 100.0),
+    ),
+    (
+        "trim_wait_levels",
+        "Trim operation wait time levels",
+        f"Thresholds for trim operation wait times in milliseconds. {_MS_NOTE}",
+        (30.0, 60.0),
+    ),
+    (
+        "rebuild_wait_levels",
+        "Rebuild operation wait time levels",
+        f"Thresholds for rebuild operation wait times in milliseconds. {_MS_NOTE}",
+        (30.0, 60.0),
+    ),
+)
+
+# Queue depth thresholds: (key, title, help text, default levels in operations)
+_OPS_LEVELS = (
+    ("syncq_read_pend_levels", "Sync read queue pending levels",
+     "Thresholds for pending synchronous read operations.", (16, 32)),
+    ("syncq_read_activ_levels", "Sync read queue active levels",
+     "Thresholds for active synchronous read operations.", (8, 16)),
+    ("syncq_write_pend_levels", "Sync write queue pending levels",
+     "Thresholds for pending synchronous write operations.", (16, 32)),
+    ("syncq_write_activ_levels", "Sync write queue active levels",
+     "Thresholds for active synchronous write operations.", (8, 16)),
+    ("asyncq_read_pend_levels", "Async read queue pending levels",
+     "Thresholds for pending asynchronous read operations.", (32, 64)),
+    ("asyncq_read_activ_levels", "Async read queue active levels",
+     "Thresholds for active asynchronous read operations.", (16, 32)),
+    ("asyncq_write_pend_levels", "Async write queue pending levels",
+     "Thresholds for pending asynchronous write operations.", (32, 64)),
+    ("asyncq_write_activ_levels", "Async write queue active levels",
+     "Thresholds for active asynchronous write operations.", (16, 32)),
+    ("scrubq_read_pend_levels", "Scrub queue pending levels",
+     "Thresholds for pending scrub read operations.", (4, 8)),
+    ("scrubq_read_activ_levels", "Scrub queue active levels",
+     "Thresholds for active scrub read operations.", (2, 4)),
+    ("trimq_write_pend_levels", "Trim queue write pending levels",
+     "Thresholds for pending trim write operations.", (4, 8)),
+    ("trimq_write_activ_levels", "Trim queue write active levels",
+     "Thresholds for active trim write operations.", (2, 4)),
+    ("rebuildq_write_pend_levels", "Rebuild queue write pending levels",
+     "Thresholds for pending rebuild write operations.", (4, 8)),
+    ("rebuildq_write_activ_levels", "Rebuild queue write active levels",
+     "Thresholds for active rebuild write operations.", (2, 4)),
+)
+
+
+# Queue depth levels are grouped in their own sub-dictionary
+_QUEUE_THRESHOLDS = "queue_thresholds"
+_QUEUE_LEVEL_KEYS = frozenset(key for key, _title, _help, _levels in _OPS_LEVELS)
+
+
+def _ms_level(title: str, help_text: str, levels: Tuple[float, float]) -> DictElement:
+    """
+    Build an optional upper-levels element for a wait time in milliseconds.
+
+    Args:
+        title: Title of the element
+        help_text: Help text of the element
+        levels: Default (warn, crit) levels in milliseconds
+
+    Returns:
+        DictElement with a SimpleLevels float form
+    """
+    return DictElement(
+        parameter_form=SimpleLevels(
+            title=Title(title),
+            help_text=Help(help_text),
+            level_direction=LevelDirection.UPPER,
+            form_spec_template=Float(
+                unit_symbol="ms",
+                custom_validate=[_MIN0_F],
+            ),
+            prefill_fixed_levels=DefaultValue(levels),
+        ),
+        required=False,
+    )
+
+
+def _ops_level(title: str, help_text: str, levels: Tuple[int, int]) -> DictElement:
+    """
+    Build an optional upper-levels element for a queue depth in operations.
+
+    Args:
+        title: Title of the element
+        help_text: Help text of the element
+        levels: Default (warn, crit) levels in operations
+
+    Returns:
+        DictElement with a SimpleLevels integer form
+    """
+    return DictElement(
+        parameter_form=SimpleLevels(
+            title=Title(title),
+            help_text=Help(help_text),
+            level_direction=LevelDirection.UPPER,
+            form_spec_template=Integer(
+                unit_symbol="operations",
+                custom_validate=[_MIN0_I],
+            ),
+            prefill_fixed_levels=DefaultValue(levels),
+        ),
+        required=False,
+    )
+
+
+def _queue_thresholds_dict() -> Dictionary:
+    """Sub-form holding the queue depth levels."""
+    return Dictionary(
+        title=_T_QUEUE,
+        help_text=_H_QUEUE,
+        elements={
+            key: _ops_level(title, help_text, levels)
+            for key, title, help_text, levels in _OPS_LEVELS
+        },
+    )
+
+
+def _migrate_queue_thresholds(value: object) -> Dict[str, Any]:
+    """
+    Move queue depth levels of rules saved before they were grouped.
+    
+    Older rules store the *_pend_levels and *_activ_levels parameters at the
+    top level. They are moved into the queue_thresholds sub-dictionary;
+    levels already stored there take precedence.
+    
+    Args:
+        value: Rule value as stored in the configuration
+        
+    Returns:
+        Rule value with all queue depth levels in queue_thresholds
+    """
+    if not isinstance(value, dict):
+        raise TypeError(value)
+    
+    moved = {key: levels for key, levels in value.items() if key in _QUEUE_LEVEL_KEYS}
+    if not moved:
+        return value
+    
+    migrated = {key: levels for key, levels in value.items() if key not in _QUEUE_LEVEL_KEYS}
+    migrated[_QUEUE_THRESHOLDS] = {**moved, **value.get(_QUEUE_THRESHOLDS, {})}
+    return migrated
+
+
+@cache
 def _parameter_form_oposs_zpool_iostat():
     """Configuration form for zpool iostat check parameters."""
     return Dictionary(
-        title=Title("OPOSS zpool iostat Ruleset Configuration"),
-        help_text=Help(
-            "Configure thresholds and monitoring options for ZFS zpool I/O statistics. "
-            "This check monitors pool I/O operations, throughput, latency, and storage utilization."
-        ),
+        title=_T_FORM,
+        help_text=_H_FORM,
         elements={
             "storage_levels": DictElement(
                 parameter_form=SimpleLevels(
@@ -41,9 +266,7 @@ def _parameter_form_oposs_zpool_iostat():
                     level_direction=LevelDirection.UPPER,
                     form_spec_template=Float(
                         unit_symbol="%",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0.0, max_value=100.0)
-                        ],
+                        custom_validate=[_PCT],
                     ),
                     prefill_fixed_levels=DefaultValue((80.0, 90.0)),
                 ),
@@ -59,9 +282,7 @@ def _parameter_form_oposs_zpool_iostat():
                     level_direction=LevelDirection.UPPER,
                     form_spec_template=Integer(
                         unit_symbol="ops/s",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0)
-                        ],
+                        custom_validate=[_MIN0_I],
                     ),
                     prefill_fixed_levels=DefaultValue((1000, 2000)),
                 ),
@@ -77,54 +298,12 @@ def _parameter_form_oposs_zpool_iostat():
                     level_direction=LevelDirection.UPPER,
                     form_spec_template=Integer(
                         unit_symbol="ops/s",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0)
-                        ],
+                        custom_validate=[_MIN0_I],
                     ),
                     prefill_fixed_levels=DefaultValue((500, 1000)),
                 ),
                 required=False,
             ),
-            "read_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Read wait time levels"),
-                    help_text=Help(
-                        "Set warning and critical thresholds for read I/O wait times in milliseconds. "
-                        "High wait times indicate storage performance issues. "
-                        "Note: Thresholds are configured in milliseconds for user convenience, "
-                        "while internally the metrics are stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(
-                        unit_symbol="ms",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0.0)
-                        ],
-                    ),
-                    prefill_fixed_levels=DefaultValue((50.0, 100.0)),
-                ),
-                required=False,
-            ),
-            "write_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Write wait time levels"),
-                    help_text=Help(
-                        "Set warning and critical thresholds for write I/O wait times in milliseconds. "
-                        "High wait times indicate storage performance issues. "
-                        "Note: Thresholds are configured in milliseconds for user convenience, "
-                        "while internally the metrics are stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(
-                        unit_symbol="ms",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0.0)
-                        ],
-                    ),
-                    prefill_fixed_levels=DefaultValue((100.0, 200.0)),
-                ),
-                required=False,
-            ),
             "read_throughput_levels": DictElement(
                 parameter_form=SimpleLevels(
                     title=Title("Read throughput levels"),
@@ -135,9 +314,7 @@ def _parameter_form_oposs_zpool_iostat():
                     level_direction=LevelDirection.UPPER,
                     form_spec_template=Integer(
                         unit_symbol="B/s",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0)
-                        ],
+                        custom_validate=[_MIN0_I],
                     ),
                     prefill_fixed_levels=DefaultValue((100000000, 200000000)),  # 100MB/s, 200MB/s
                 ),
@@ -153,273 +330,29 @@ def _parameter_form_oposs_zpool_iostat():
                     level_direction=LevelDirection.UPPER,
                     form_spec_template=Integer(
                         unit_symbol="B/s",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0)
-                        ],
+                        custom_validate=[_MIN0_I],
                     ),
                     prefill_fixed_levels=DefaultValue((50000000, 100000000)),  # 50MB/s, 100MB/s
                 ),
                 required=False,
             ),
-            "disk_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Disk I/O wait time levels"),
-                    help_text=Help(
-                        "Set warning and critical thresholds for disk-level I/O wait times in milliseconds. "
-                        "Monitors disk_read_wait and disk_write_wait metrics from zpool iostat. "
-                        "Note: Thresholds are configured in milliseconds for user convenience, "
-                        "while internally the metrics are stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(
-                        unit_symbol="ms",
-                        custom_validate=[
-                            validators.NumberInRange(min_value=0.0)
-                        ],
-                    ),
-                    prefill_fixed_levels=DefaultValue((20.0, 50.0)),
-                ),
-                required=False,
-            ),
-            "syncq_read_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Sync read queue wait time levels"),
-                    help_text=Help(
-                        "Thresholds for synchronous read queue wait times in milliseconds. "
-                        "Note: Configured in milliseconds, internally stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(unit_symbol="ms"),
-                    prefill_fixed_levels=DefaultValue((10.0, 25.0)),
-                ),
-                required=False,
-            ),
-            "syncq_write_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Sync write queue wait time levels"),
-                    help_text=Help(
-                        "Thresholds for synchronous write queue wait times in milliseconds. "
-                        "Note: Configured in milliseconds, internally stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(unit_symbol="ms"),
-                    prefill_fixed_levels=DefaultValue((10.0, 25.0)),
-                ),
-                required=False,
-            ),
-            "asyncq_read_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Async read queue wait time levels"),
-                    help_text=Help(
-                        "Thresholds for asynchronous read queue wait times in milliseconds. "
-                        "Note: Configured in milliseconds, internally stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(unit_symbol="ms"),
-                    prefill_fixed_levels=DefaultValue((5.0, 15.0)),
-                ),
-                required=False,
-            ),
-            "asyncq_write_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Async write queue wait time levels"),
-                    help_text=Help(
-                        "Thresholds for asynchronous write queue wait times in milliseconds. "
-                        "Note: Configured in milliseconds, internally stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(unit_symbol="ms"),
-                    prefill_fixed_levels=DefaultValue((5.0, 15.0)),
-                ),
-                required=False,
-            ),
-            "scrub_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Scrub operation wait time levels"),
-                    help_text=Help(
-                        "Thresholds for scrub operation wait times in milliseconds. "
-                        "Note: Configured in milliseconds, internally stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(unit_symbol="ms"),
-                    prefill_fixed_levels=DefaultValue((50.0, 100.0)),
-                ),
-                required=False,
-            ),
-            "trim_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Trim operation wait time levels"),
-                    help_text=Help(
-                        "Thresholds for trim operation wait times in milliseconds. "
-                        "Note: Configured in milliseconds, internally stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(unit_symbol="ms"),
-                    prefill_fixed_levels=DefaultValue((30.0, 60.0)),
-                ),
-                required=False,
-            ),
-            "rebuild_wait_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Rebuild operation wait time levels"),
-                    help_text=Help(
-                        "Thresholds for rebuild operation wait times in milliseconds. "
-                        "Note: Configured in milliseconds, internally stored in seconds."
-                    ),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Float(unit_symbol="ms"),
-                    prefill_fixed_levels=DefaultValue((30.0, 60.0)),
-                ),
-                required=False,
-            ),
-            "syncq_read_pend_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Sync read queue pending levels"),
-                    help_text=Help("Thresholds for pending synchronous read operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((16, 32)),
-                ),
-                required=False,
-            ),
-            "syncq_read_activ_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Sync read queue active levels"),
-                    help_text=Help("Thresholds for active synchronous read operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((8, 16)),
-                ),
-                required=False,
-            ),
-            "syncq_write_pend_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Sync write queue pending levels"),
-                    help_text=Help("Thresholds for pending synchronous write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((16, 32)),
-                ),
-                required=False,
-            ),
-            "syncq_write_activ_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Sync write queue active levels"),
-                    help_text=Help("Thresholds for active synchronous write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((8, 16)),
-                ),
-                required=False,
-            ),
-            "asyncq_read_pend_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Async read queue pending levels"),
-                    help_text=Help("Thresholds for pending asynchronous read operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((32, 64)),
-                ),
-                required=False,
-            ),
-            "asyncq_read_activ_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Async read queue active levels"),
-                    help_text=Help("Thresholds for active asynchronous read operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((16, 32)),
-                ),
-                required=False,
-            ),
-            "asyncq_write_pend_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Async write queue pending levels"),
-                    help_text=Help("Thresholds for pending asynchronous write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((32, 64)),
-                ),
-                required=False,
-            ),
-            "asyncq_write_activ_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Async write queue active levels"),
-                    help_text=Help("Thresholds for active asynchronous write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((16, 32)),
-                ),
-                required=False,
-            ),
-            "scrubq_read_pend_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Scrub queue pending levels"),
-                    help_text=Help("Thresholds for pending scrub read operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((4, 8)),
-                ),
-                required=False,
-            ),
-            "scrubq_read_activ_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Scrub queue active levels"),
-                    help_text=Help("Thresholds for active scrub read operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((2, 4)),
-                ),
-                required=False,
-            ),
-            "trimq_write_pend_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Trim queue write pending levels"),
-                    help_text=Help("Thresholds for pending trim write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((4, 8)),
-                ),
-                required=False,
-            ),
-            "trimq_write_activ_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Trim queue write active levels"),
-                    help_text=Help("Thresholds for active trim write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((2, 4)),
-                ),
-                required=False,
-            ),
-            "rebuildq_write_pend_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Rebuild queue write pending levels"),
-                    help_text=Help("Thresholds for pending rebuild write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((4, 8)),
-                ),
-                required=False,
-            ),
-            "rebuildq_write_activ_levels": DictElement(
-                parameter_form=SimpleLevels(
-                    title=Title("Rebuild queue write active levels"),
-                    help_text=Help("Thresholds for active rebuild write operations."),
-                    level_direction=LevelDirection.UPPER,
-                    form_spec_template=Integer(unit_symbol="operations"),
-                    prefill_fixed_levels=DefaultValue((2, 4)),
-                ),
+            **{
+                key: _ms_level(title, help_text, levels)
+                for key, title, help_text, levels in _MS_LEVELS
+            },
+            _QUEUE_THRESHOLDS: DictElement(
+                parameter_form=_queue_thresholds_dict(),
                 required=False,
             ),
         },
+        migrate=_migrate_queue_thresholds,
     )
 
 # Register the check parameters ruleset
 rule_spec_oposs_zpool_iostat = CheckParameters(
-    title=Title("OPOSS zpool iostat Ruleset"),
+    title=_T_RULESET,
     topic=Topic.STORAGE,
     name="oposs_zpool_iostat",
     parameter_form=_parameter_form_oposs_zpool_iostat,
-    condition=HostAndItemCondition(item_title=Title("ZPool name")),
-)
\ No newline at end of file
+    condition=HostAndItemCondition(item_title=_T_ITEM),
+)
@@ -4,28 +4,34 @@ CheckMK Agent Bakery ruleset for OPOSS zpool iostat monitoring
 Provides GUI configuration interface for Agent Bakery deployment
 """
 
+from functools import cache
+
 from cmk.rulesets.v1 import Label, Title, Help
 from cmk.rulesets.v1.form_specs import (
-    BooleanChoice,
     DefaultValue,
     DictElement,
     Dictionary,
     Integer,
     TimeSpan,
     TimeMagnitude,
-    validators,
 )
 from cmk.rulesets.v1.rule_specs import AgentConfig, Topic
 
+# Titles and help texts of the ruleset itself
+_T_RULESET = Title("OPOSS zpool iostat Agent Deployment")
+_T_FORM = Title("OPOSS zpool iostat Agent Configuration")
+_H_FORM = Help(
+    "Configure the OPOSS zpool iostat monitoring agent plugin for automated deployment. "
+    "This plugin collects detailed I/O statistics from ZFS storage pools including "
+    "operations per second, throughput, wait times, and queue depths."
+)
+
+@cache
 def _parameter_form_oposs_zpool_iostat_bakery():
     """Configuration interface for zpool iostat agent plugin."""
     return Dictionary(
-        title=Title("OPOSS zpool iostat Agent Configuration"),
-        help_text=Help(
-            "Configure the OPOSS zpool iostat monitoring agent plugin for automated deployment. "
-            "This plugin collects detailed I/O statistics from ZFS storage pools including "
-            "operations per second, throughput, wait times, and queue depths."
-        ),
+        title=_T_FORM,
+        help_text=_H_FORM,
         elements={
             "interval": DictElement(
                 parameter_form=TimeSpan(
@@ -68,7 +74,7 @@ def _parameter_form_oposs_zpool_iostat_bakery():
 # Register the bakery rule specification
 rule_spec_oposs_zpool_iostat_bakery = AgentConfig(
     name="oposs_zpool_iostat",
-    title=Title("OPOSS zpool iostat Agent Deployment"),
+    title=_T_RULESET,
     topic=Topic.GENERAL,
     parameter_form=_parameter_form_oposs_zpool_iostat_bakery,
 )
\ No newline at end of file